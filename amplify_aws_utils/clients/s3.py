@@ -3,14 +3,16 @@ Manage interaction with S3 API
 """
 import hashlib
 import logging
-from typing import Dict, Any, Sequence, IO
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, Sequence, IO, Tuple, Union
 
 from botocore.exceptions import ClientError
 
 from mypy_boto3_s3.client import S3Client
 
+from amplify_aws_utils.exceptions import S3BulkWriteError
 from amplify_aws_utils.resource_helper import (
-    get_boto3_paged_results,
+    iter_boto3_paged_results,
     throttled_call,
     dict_to_boto3_tags,
     boto3_tags_to_dict,
@@ -38,16 +40,29 @@ class S3:
         :param kwargs: Any additional arguments to pass to the underlying boto call.
         :return: A list of all of the objects.
         """
-        results = get_boto3_paged_results(
+        return list(self.iter_objects(bucket=bucket, prefix=prefix, **kwargs))
+
+    def iter_objects(
+        self, bucket: str, prefix: str, **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Convenience function for lazily iterating over objects in an S3 bucket with paging handled.
+        Only one page of objects is held in memory at a time.
+        :param bucket: Name of the bucket.
+        :param prefix: Prefix of the objects to list.
+        :param kwargs: Any additional arguments to pass to the underlying boto call.
+        :return: An iterator over all of the objects.
+        """
+        return iter_boto3_paged_results(
             self.s3.list_objects_v2,
             results_key="Contents",
+            next_token_key="NextContinuationToken",
+            next_request_token_key="ContinuationToken",
             Bucket=bucket,
             Prefix=prefix,
             **kwargs
         )
 
-        return results
-
     def list_versions(
         self, bucket: str, prefix: str, **kwargs
     ) -> Sequence[Dict[str, Any]]:
@@ -58,7 +73,20 @@ class S3:
         :param kwargs: Any additional arguments to pass to the underlying boto call.
         :return: A list of all of the object versions.
         """
-        results = get_boto3_paged_results(
+        return list(self.iter_versions(bucket=bucket, prefix=prefix, **kwargs))
+
+    def iter_versions(
+        self, bucket: str, prefix: str, **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Convenience function for lazily iterating over all the versions in an S3 bucket with paging handled.
+        Only one page of versions is held in memory at a time.
+        :param bucket: Name of the bucket.
+        :param prefix: Prefix of the objects to list.
+        :param kwargs: Any additional arguments to pass to the underlying boto call.
+        :return: An iterator over all of the object versions.
+        """
+        return iter_boto3_paged_results(
             self.s3.list_object_versions,
             results_key="Versions",
             next_token_key="NextVersionIdMarker",
@@ -68,8 +96,6 @@ class S3:
             **kwargs
         )
 
-        return results
-
     def read_file(self, bucket: str, key: str, wait: bool = False, **kwargs) -> str:
         """
         Convenience function for reading an object out of S3.
@@ -126,7 +152,7 @@ class S3:
             ExtraArgs=kwargs,
         )
 
-    def write_file(self, bucket: str, key: str, body: str, **kwargs):
+    def write_file(self, bucket: str, key: str, body: Union[str, bytes], **kwargs):
         """
         Convenience function for writing an object to S3.
         :param bucket: Name of the bucket.
@@ -136,6 +162,43 @@ class S3:
         """
         throttled_call(self.s3.put_object, Bucket=bucket, Key=key, Body=body, **kwargs)
 
+    def put_objects_bulk(
+        self,
+        bucket: str,
+        items: Iterable[Tuple[str, Union[str, bytes]]],
+        max_workers: int = 16,
+        **kwargs
+    ):
+        """
+        Convenience function for writing many objects to S3 concurrently.
+        Note that boto3 clients only keep 10 connections per host by default, so create the client
+        with botocore.config.Config(max_pool_connections=max_workers) to use every worker.
+        :param bucket: Name of the bucket.
+        :param items: Pairs of key and contents of the objects to write.
+        :param max_workers: Maximum number of objects to write at the same time.
+        :param kwargs: Any additional arguments to pass to the underlying boto call.
+        :raises S3BulkWriteError: Once every write has finished, if any of them failed.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (
+                    key,
+                    executor.submit(
+                        self.write_file, bucket=bucket, key=key, body=body, **kwargs
+                    ),
+                )
+                for key, body in items
+            ]
+
+        # every write has finished by now, report all of the ones that failed
+        errors = {}
+        for key, future in futures:
+            error = future.exception()
+            if error is not None:
+                errors[key] = error
+        if errors:
+            raise S3BulkWriteError(errors)
+
     def delete_file(self, bucket: str, key: str, **kwargs):
         """
         Convenience function for deleting an object out of S3.
@@ -207,13 +270,17 @@ class S3:
         )
         return boto3_tags_to_dict(boto_tags["TagSet"])
 
-    def hash_file(self, bucket: str, key: str, **kwargs) -> str:
+    def hash_file(
+        self, bucket: str, key: str, algorithm: str = "sha256", **kwargs
+    ) -> str:
         """
         Convenience function for getting the hash of an object from S3
         :param bucket: Name of the bucket.
         :param key: Name of the key.
+        :param algorithm: Name of any algorithm supported by hashlib.new. blake2b is considerably faster
+        than sha256 when the hash is only used to fingerprint content.
         :param kwargs: Any additional arguments to pass to the underlying boto call.
-        :return: SHA256 hash of the object.
+        :return: Hex digest of the object.
         """
         stream = throttled_call(self.s3.get_object, Bucket=bucket, Key=key, **kwargs)[
             "Body"
@@ -222,7 +289,7 @@ class S3:
         # 5 megabytes
         block_size = 5242880
 
-        hasher = hashlib.sha256()
+        hasher = hashlib.new(algorithm)
         buffer = stream.read(block_size)
 
         while buffer:
@@ -7,18 +7,39 @@ import requests
 # pylint: disable=redefined-builtin
 from requests.exceptions import Timeout, ConnectionError
 
-from amplify_aws_utils.jitter import Jitter
+from amplify_aws_utils.jitter import DecorrelatedJitter
 
 SPOTINST_API_HOST = "https://api.spotinst.io"
+SPOTINST_GROUP_PATH = "aws/ec2/group"
+# Error codes in a failed response that mean the request can be retried once the rate limit resets
+SPOTINST_RETRYABLE_ERROR_CODES = frozenset(("Throttling", "RequestLimitExceeded"))
+# HTTP status codes that mean the request can be retried, whatever the response body says
+SPOTINST_RETRYABLE_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
 logger = logging.getLogger(__name__)
 
 
 class SpotinstClient:
     """A client for the Spotinst REST API"""
 
-    def __init__(self, token: str, account_id: str):
+    GROUP_URL = f"{SPOTINST_API_HOST}/{SPOTINST_GROUP_PATH}"
+
+    def __init__(
+        self,
+        token: str,
+        account_id: str,
+        sleeper: Optional[Callable[[float], Any]] = None,
+    ):
+        """
+        :param token: Spotinst API token.
+        :param account_id: Spotinst account to make requests in.
+        :param sleeper: Called with each backoff interval when throttled. Defaults to `time.sleep`.
+        """
         self.token = token
         self.account_id = account_id
+        self._sleeper = sleeper
+        # The session's default adapter pools connections to the API host, so requests reuse
+        # them instead of making a new TCP/TLS handshake each time
+        self._session = requests.Session()
 
     def create_group(self, group_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -28,7 +49,7 @@ class SpotinstClient:
         :rtype: dict
         """
         response = self._make_throttled_request(
-            path="aws/ec2/group", data=group_config, method="post"
+            path=SPOTINST_GROUP_PATH, data=group_config, method="post"
         )
         return response["response"]["items"][0]
 
@@ -39,7 +60,7 @@ class SpotinstClient:
         :param dict group_config: New group config
         """
         self._make_throttled_request(
-            path=f"aws/ec2/group/{group_id}", data=group_config, method="put"
+            path=f"{SPOTINST_GROUP_PATH}/{group_id}", data=group_config, method="put"
         )
 
     def get_group(self, group_id: str) -> Dict[str, Any]:
@@ -50,7 +71,7 @@ class SpotinstClient:
         :rtype: list[dict]
         """
         response = self._make_throttled_request(
-            path=f"aws/ec2/group/{group_id}", method="get"
+            path=f"{SPOTINST_GROUP_PATH}/{group_id}", method="get"
         )
         return response["response"]["items"][0]
 
@@ -62,7 +83,7 @@ class SpotinstClient:
         :rtype: list[dict]
         """
         response = self._make_throttled_request(
-            path=f"aws/ec2/group/{group_id}" + "/status", method="get"
+            path=f"{SPOTINST_GROUP_PATH}/{group_id}/status", method="get"
         )
         return response["response"]["items"]
 
@@ -72,7 +93,7 @@ class SpotinstClient:
         :return: Lst of Elastigroups
         :rtype: list[dict]
         """
-        return self._make_throttled_request(path="aws/ec2/group", method="get")[
+        return self._make_throttled_request(path=SPOTINST_GROUP_PATH, method="get")[
             "response"
         ]["items"]
 
@@ -81,7 +102,9 @@ class SpotinstClient:
         Delete an Elastigroup
         :param str group_id: Id of group to delete
         """
-        self._make_throttled_request(path=f"aws/ec2/group/{group_id}", method="delete")
+        self._make_throttled_request(
+            path=f"{SPOTINST_GROUP_PATH}/{group_id}", method="delete"
+        )
 
     def roll_group(
         self,
@@ -105,7 +128,7 @@ class SpotinstClient:
             "strategy": {"action": "REPLACE_SERVER"},
         }
         self._make_throttled_request(
-            path=f"aws/ec2/group/{group_id}/roll", data=request, method="put"
+            path=f"{SPOTINST_GROUP_PATH}/{group_id}/roll", data=request, method="put"
         )
 
     def get_deployments(self, group_id: str) -> List[Dict[str, Any]]:
@@ -115,7 +138,7 @@ class SpotinstClient:
         :return list[dict]:
         """
         response = self._make_throttled_request(
-            path=f"aws/ec2/group/{group_id}/roll", method="get"
+            path=f"{SPOTINST_GROUP_PATH}/{group_id}/roll", method="get"
         )
         deploys = response["response"]["items"]
         return sorted(deploys, key=lambda deploy: deploy["createdAt"])
@@ -128,7 +151,7 @@ class SpotinstClient:
         :return dict:
         """
         response = self._make_throttled_request(
-            path=f"aws/ec2/group/{group_id}/roll/{deploy_id}", method="get"
+            path=f"{SPOTINST_GROUP_PATH}/{group_id}/roll/{deploy_id}", method="get"
         )
         return response["response"]["items"][0]
 
@@ -139,7 +162,7 @@ class SpotinstClient:
         :return dict:
         """
         response = self._make_throttled_request(
-            path=f"aws/ec2/group/{group_id}/instanceHealthiness", method="get"
+            path=f"{SPOTINST_GROUP_PATH}/{group_id}/instanceHealthiness", method="get"
         )
         return response["response"]["items"]
 
@@ -175,7 +198,7 @@ class SpotinstClient:
             params = params or {}
             params["accountId"] = self.account_id
 
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=f"{SPOTINST_API_HOST}/{path}",
                 params=params,
@@ -194,9 +217,9 @@ class SpotinstClient:
         if response.status_code == 401:
             raise SpotinstApiException("Provided Spotinst API token is not valid")
 
-        if response.status_code == 429:
+        if response.status_code in SPOTINST_RETRYABLE_STATUS_CODES:
             raise SpotinstRateExceededException(
-                f"Rate exceeded while calling {method} {path}"
+                f"Rate exceeded while calling {method} {path}: HTTP {response.status_code}"
             )
 
         try:
@@ -212,7 +235,7 @@ class SpotinstClient:
             errors = ret["response"].get("errors") or []
 
             for error in errors:
-                if error.get("code") in ("Throttling", "RequestLimitExceeded"):
+                if error.get("code") in SPOTINST_RETRYABLE_ERROR_CODES:
                     raise SpotinstRateExceededException(
                         f"Rate exceeded while calling {method} {path}"
                     )
@@ -225,9 +248,8 @@ class SpotinstClient:
 
     def _throttle_spotinst_call(self, fun: Callable, *args, **kwargs):
         max_time = 5 * 60
-        jitter = Jitter(
-            min_wait=60
-        )  # wait at least 60 seconds because our rate limit resets then
+        # wait at least 60 seconds because our rate limit resets then
+        jitter = DecorrelatedJitter(min_wait=60, sleeper=self._sleeper)
         time_passed = 0
 
         while True:
@@ -1,6 +1,7 @@
 """
 Container for amplify_aws_utils exceptions
 """
+from typing import Dict
 
 
 # pylint: disable=redefined-builtin
@@ -20,5 +21,18 @@ class S3WritingError(RuntimeError):
     """S3 object is not written correctly"""
 
 
+class S3BulkWriteError(S3WritingError):
+    """One or more S3 objects in a bulk write failed to be written"""
+
+    def __init__(self, errors: Dict[str, BaseException]):
+        """
+        :param errors: The exception raised for each key that failed to be written.
+        """
+        super().__init__(
+            f"Failed to write {len(errors)} object(s): {', '.join(sorted(errors))}"
+        )
+        self.errors = errors
+
+
 class CatchAllExceptionError(RuntimeError):
     """Error raised when handling catch all exceptions for an app/service"""
@@ -1,38 +1,127 @@
-"""Contains Jitter class"""
+"""Contains Jitter classes"""
+import random
 import time
-from random import randint
+from typing import Any, Callable, Optional
 
 
 class Jitter:
     """
-    This class implements the logic to run an AWS command using Backoff with Decorrelated Jitter.
+    This class implements the logic to run an AWS command using capped exponential Backoff with Full Jitter.
     The logic is based on the following article:
-    https://www.awsarchitectureblog.com/2015/03/backoff.html
+    https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
     """
 
     MAX_POLL_INTERVAL = 60  # seconds
+    # 2 ** 32 puts any min_wait past MAX_POLL_INTERVAL, and keeps float caps from overflowing
+    MAX_BACKOFF_EXPONENT = 32
 
-    def __init__(self, min_wait: int = 3):
-        self._time_passed = 0
+    def __init__(
+        self,
+        min_wait: int = 3,
+        rng: Optional[random.Random] = None,
+        sleeper: Optional[Callable[[float], Any]] = None,
+    ):
+        """
+        :param min_wait: Base number of seconds the backoff cap grows from. Since 0.6.0 this is not a
+        minimum wait, intervals can be close to zero; use DecorrelatedJitter to keep that guarantee.
+        :param rng: Random number generator to draw intervals from. Defaults to the module level
+        generator in `random`; pass a seeded `random.Random` for reproducible backoff.
+        :param sleeper: Called with each interval to wait it out. Defaults to `time.sleep`.
+        """
+        self._time_passed: float = 0
         self._min_wait = min_wait
-        self._previous_interval = 0
+        self._attempt = 0
+        self._rng = rng or random
+        self._sleeper = sleeper
+
+    @property
+    def time_passed(self) -> float:
+        """The total number of seconds slept by this Jitter so far"""
+        return self._time_passed
+
+    @property
+    def attempt(self) -> int:
+        """The number of times this Jitter has backed off so far"""
+        return self._attempt
 
     def backoff(self):
         """
-        Uses a slightly modified version of the Decorrelated Jitter function as described in the AWS blog
-
-        The main change is:
-            A random value is chosen from 0 and min(max_poll_interval, prev_value * 3)
-            This is different than min(max_poll_interval, rand(0, prev_value * 3) as defined in the blog
-            We chose to do this to make sure we continue to get random backoff values instead of
-            constantly returning the max value once enough time has passed
+        Sleeps for the next backoff interval.
+        :return: The total number of seconds slept by this Jitter so far.
         """
-        new_interval = randint(
-            0, min(Jitter.MAX_POLL_INTERVAL, self._previous_interval * 3)
-        )
-        new_interval = max(self._min_wait, new_interval)
+        # time.sleep is looked up at call time so patching it keeps working for the default
+        (self._sleeper or time.sleep)(self.advance())
+        return self._time_passed
 
-        time.sleep(new_interval)
+    def advance(self) -> float:
+        """
+        Records the next backoff interval without sleeping, for callers that wait some other way,
+        e.g. with asyncio.sleep.
+        :return: The number of seconds to wait before the next attempt.
+        """
+        new_interval = self._next_interval()
         self._time_passed += new_interval
-        self._previous_interval = new_interval
-        return self._time_passed
+        self._attempt += 1
+        return new_interval
+
+    def _next_interval(self) -> float:
+        """
+        Uses the Full Jitter function as described in the AWS blog:
+            sleep = random_between(0, min(max_poll_interval, min_wait * 2 ** attempt))
+        """
+        return self._rng.uniform(0, self._cap())
+
+    def _cap(self) -> float:
+        """
+        The exponentially growing bound on the next interval:
+            min(max_poll_interval, min_wait * 2 ** attempt)
+        """
+        exponent = min(self._attempt, self.MAX_BACKOFF_EXPONENT)
+        return min(self.MAX_POLL_INTERVAL, self._min_wait * (1 << exponent))
+
+
+class EqualJitter(Jitter):
+    """
+    Backoff with Equal Jitter, for rate limit errors where retrying almost immediately is pointless.
+    The logic is based on the following article:
+    https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    """
+
+    def _next_interval(self) -> float:
+        """
+        Uses the Equal Jitter function as described in the AWS blog:
+            temp = min(max_poll_interval, min_wait * 2 ** attempt)
+            sleep = temp / 2 + random_between(0, temp / 2)
+        """
+        half_cap = self._cap() / 2
+        return half_cap + self._rng.uniform(0, half_cap)
+
+
+class DecorrelatedJitter(Jitter):
+    """
+    Backoff with Decorrelated Jitter, for callers that must never retry sooner than min_wait.
+    The logic is based on the following article:
+    https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    """
+
+    def __init__(
+        self,
+        min_wait: int = 3,
+        rng: Optional[random.Random] = None,
+        sleeper: Optional[Callable[[float], Any]] = None,
+    ):
+        super().__init__(min_wait=min_wait, rng=rng, sleeper=sleeper)
+        self._previous_interval: float = min_wait
+
+    def _next_interval(self) -> float:
+        """
+        Uses the Decorrelated Jitter function as described in the AWS blog:
+            sleep = min(max_poll_interval, random_between(min_wait, prev_sleep * 3))
+
+        The cap never drops below min_wait, so every interval is at least min_wait.
+        """
+        self._previous_interval = min(
+            max(self.MAX_POLL_INTERVAL, self._min_wait),
+            self._rng.uniform(self._min_wait, self._previous_interval * 3),
+        )
+        return self._previous_interval
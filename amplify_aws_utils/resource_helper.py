@@ -1,16 +1,31 @@
 """
 This module has utility functions for working with aws resources
 """
+import asyncio
+import functools
 import logging
+import threading
+import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import boto3
 from aws_lambda_powertools.middleware_factory import lambda_handler_decorator
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.exceptions import ClientError, WaiterError, ReadTimeoutError
 
-from amplify_aws_utils.jitter import Jitter
+from amplify_aws_utils.jitter import DecorrelatedJitter, EqualJitter, Jitter
 
 # pylint: disable=redefined-builtin
 from .exceptions import (
@@ -24,6 +39,22 @@ logger = logging.getLogger(__name__)
 
 STATE_POLL_INTERVAL = 2  # seconds
 INSTANCE_SSHABLE_POLL_INTERVAL = 15  # seconds
+THROTTLED_CALL_MAX_TIME = 5 * 60  # seconds
+
+# Substrings of ClientError codes that mean the caller is being rate limited
+RATE_LIMIT_ERROR_KEYWORDS = (
+    "Throttling",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+)
+# Substrings of ClientError codes that throttled_call treats as retryable
+THROTTLING_ERROR_KEYWORDS = RATE_LIMIT_ERROR_KEYWORDS + ("ServiceUnavailable",)
+# Resource states that wait_for_state_boto3 gives up on instead of waiting out the timeout
+FAILURE_STATES = frozenset(("failed", "terminated"))
+
+# Describe responses shared between wait_for_state_boto3 callers, keyed by call
+_DESCRIBE_CACHE: Dict[Tuple[Callable, str], Tuple[float, Any]] = {}
+_DESCRIBE_CACHE_LOCK = threading.Lock()
 
 
 def create_filters(filter_dict):
@@ -88,9 +119,11 @@ def throttled_call(fun, *args, **kwargs):
     not throw a throttled exception or 5 minutes have passed.
 
     After each failed attempt a delay is introduced using Jitter.backoff() function.
+    Rate limit errors back off with EqualJitter instead, so the delay never collapses
+    to almost nothing before the rate limit window has a chance to clear.
     """
-    max_time = 5 * 60
     jitter = Jitter()
+    rate_limit_jitter = EqualJitter()
     time_passed = 0
 
     while True:
@@ -102,24 +135,26 @@ def throttled_call(fun, *args, **kwargs):
 
             error_code = err.response["Error"].get("Code", "Unknown")
             is_throttle_exception = any(
-                key_word in error_code
-                for key_word in (
-                    "Throttling",
-                    "RequestLimitExceeded",
-                    "TooManyRequestsException",
-                    "ServiceUnavailable",
-                )
+                key_word in error_code for key_word in THROTTLING_ERROR_KEYWORDS
             )
 
-            if not is_throttle_exception or time_passed > max_time:
+            if not is_throttle_exception or time_passed > THROTTLED_CALL_MAX_TIME:
                 raise
 
-            time_passed = jitter.backoff()
+            is_rate_limited = any(
+                key_word in error_code for key_word in RATE_LIMIT_ERROR_KEYWORDS
+            )
+            if is_rate_limited:
+                rate_limit_jitter.backoff()
+            else:
+                jitter.backoff()
+            time_passed = jitter.time_passed + rate_limit_jitter.time_passed
         except (ReadTimeoutError, WaiterError):
-            if time_passed > max_time:
+            if time_passed > THROTTLED_CALL_MAX_TIME:
                 raise
 
-            time_passed = jitter.backoff()
+            jitter.backoff()
+            time_passed = jitter.time_passed + rate_limit_jitter.time_passed
 
 
 def wait_for_state_boto3(
@@ -129,33 +164,30 @@ def wait_for_state_boto3(
     expected_state,
     state_attr="state",
     timeout=15 * 60,
+    cache_ttl=0,
 ):
-    """Wait for an AWS resource to reach a specified state using the boto3 library"""
-    jitter = Jitter()
+    """
+    Wait for an AWS resource to reach a specified state using the boto3 library
+
+    Polls are spaced out using DecorrelatedJitter, so concurrent waiters drift apart
+    instead of hitting the describe API in lockstep.
+
+    When cache_ttl is set, a describe response is reused by any wait_for_state_boto3 call
+    with the same describe_func and params_dict for cache_ttl seconds. This lets many
+    waiters on the same resource share one describe call. Keep it shorter than the poll
+    interval, or a single waiter will re-read its own stale response.
+    """
+    jitter = DecorrelatedJitter()
     time_passed = 0
     while True:
         try:
-            resources = describe_func(**params_dict)[resources_name]
-            if not isinstance(resources, list):
-                resources = [resources]
-
-            all_good = True
-            failure = False
-            for resource in resources:
-                if resource[state_attr] in ("failed", "terminated"):
-                    failure = True
-                    all_good = False
-                elif resource[state_attr] != expected_state:
-                    all_good = False
-
-            if all_good:
+            resources = _cached_describe(describe_func, params_dict, cache_ttl)[
+                resources_name
+            ]
+            if _resources_in_state(
+                resources, expected_state, state_attr, params_dict, time_passed
+            ):
                 return
-            if failure:
-                raise ExpectedTimeoutError(
-                    "At least some resources who meet the following description "
-                    "entered either 'failed' or 'terminated' state "
-                    f"after {time_passed}s waiting for state {expected_state}:\n{params_dict}"
-                )
         except ClientError:
             pass  # These are most likely transient, we will timeout if they are not
 
@@ -168,27 +200,156 @@ def wait_for_state_boto3(
         time_passed = jitter.backoff()
 
 
+async def wait_for_state_boto3_async(
+    describe_func,
+    params_dict,
+    resources_name,
+    expected_state,
+    state_attr="state",
+    timeout=15 * 60,
+    cache_ttl=0,
+):
+    """
+    Coroutine version of wait_for_state_boto3, taking the same arguments.
+
+    The blocking describe call runs in the event loop's default executor and the waits between
+    polls use asyncio.sleep, so many waiters can run concurrently in one thread.
+    See wait_for_all_states_boto3.
+    """
+    loop = asyncio.get_running_loop()
+    jitter = DecorrelatedJitter()
+    time_passed = 0
+    while True:
+        try:
+            response = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    _cached_describe, describe_func, params_dict, cache_ttl
+                ),
+            )
+            if _resources_in_state(
+                response[resources_name],
+                expected_state,
+                state_attr,
+                params_dict,
+                time_passed,
+            ):
+                return
+        except ClientError:
+            pass  # These are most likely transient, we will timeout if they are not
+
+        if time_passed >= timeout:
+            raise TimeoutError(
+                "Timed out waiting for resources who meet the following description to change "
+                f"state to {expected_state} after {time_passed}s:\n{params_dict}"
+            )
+
+        await asyncio.sleep(jitter.advance())
+        time_passed = jitter.time_passed
+
+
+async def wait_for_all_states_boto3(specs: Iterable[Dict[str, Any]]):
+    """
+    Waits for several sets of AWS resources to reach their states concurrently.
+
+    Takes as long as the slowest wait rather than the sum of all of them. As soon as one wait
+    fails, the others are cancelled and its error is raised.
+    :param specs: The keyword arguments for each wait_for_state_boto3_async call.
+    """
+    pending = {
+        asyncio.ensure_future(wait_for_state_boto3_async(**spec)) for spec in specs
+    }
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _resources_in_state(
+    resources, expected_state, state_attr, params_dict, time_passed
+) -> bool:
+    """
+    Checks whether every described resource is in expected_state
+    :raises ExpectedTimeoutError: If any resource is in one of the FAILURE_STATES.
+    """
+    if not isinstance(resources, list):
+        resources = [resources]
+
+    all_good = True
+    failure = False
+    for resource in resources:
+        if resource[state_attr] in FAILURE_STATES:
+            failure = True
+            all_good = False
+        elif resource[state_attr] != expected_state:
+            all_good = False
+
+    if failure:
+        raise ExpectedTimeoutError(
+            "At least some resources who meet the following description "
+            "entered either 'failed' or 'terminated' state "
+            f"after {time_passed}s waiting for state {expected_state}:\n{params_dict}"
+        )
+    return all_good
+
+
+def _cached_describe(describe_func, params_dict, cache_ttl):
+    """
+    Calls describe_func with params_dict, reusing a response from the last cache_ttl seconds
+    """
+    if cache_ttl <= 0:
+        return describe_func(**params_dict)
+
+    key = (describe_func, repr(sorted(params_dict.items())))
+    with _DESCRIBE_CACHE_LOCK:
+        cached = _DESCRIBE_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < cache_ttl:
+        return cached[1]
+
+    response = describe_func(**params_dict)
+    now = time.monotonic()
+    with _DESCRIBE_CACHE_LOCK:
+        for stale_key in [
+            cache_key
+            for cache_key, (cached_at, _) in _DESCRIBE_CACHE.items()
+            if now - cached_at >= cache_ttl
+        ]:
+            del _DESCRIBE_CACHE[stale_key]
+        _DESCRIBE_CACHE[key] = (now, response)
+
+    return response
+
+
 # pylint: disable=keyword-arg-before-vararg
-def get_boto3_paged_results(
+def iter_boto3_paged_results(
     func: Callable,
     results_key: str,
     next_token_key: str = "NextToken",
     next_request_token_key: str = "NextToken",
     *args,
     **kwargs,
-) -> List:
+) -> Iterator:
     """
-    Helper method for automatically making multiple boto3 requests for their listing functions
+    Helper method for lazily iterating over the items of boto3 listing functions.
+    Each page is only requested once the items of the previous page have been consumed.
     :param func: Boto3 function to call
     :param results_key: Key of response dict that contains list items
     :param next_token_key: Key of the response dict that contains the paging token
     :param next_request_token_key: Name of the request parameter to pass the token key as.
-    :return list:
+    :return iterator:
     """
     response = throttled_call(func, *args, **kwargs)
     response_items = response.get(results_key, [])
     if not response_items:
         logger.debug("No items found in response=%s", response)
+    yield from response_items
 
     next_token = response.get(next_token_key)
     prev_token = None
@@ -197,11 +358,33 @@ def get_boto3_paged_results(
     while next_token and next_token != prev_token:
         kwargs[next_request_token_key] = next_token
         response = throttled_call(func, *args, **kwargs)
-        response_items += response[results_key]
+        yield from response[results_key]
         prev_token = next_token
         next_token = response.get(next_token_key)
 
-    return response_items
+
+# pylint: disable=keyword-arg-before-vararg
+def get_boto3_paged_results(
+    func: Callable,
+    results_key: str,
+    next_token_key: str = "NextToken",
+    next_request_token_key: str = "NextToken",
+    *args,
+    **kwargs,
+) -> List:
+    """
+    Helper method for automatically making multiple boto3 requests for their listing functions
+    :param func: Boto3 function to call
+    :param results_key: Key of response dict that contains list items
+    :param next_token_key: Key of the response dict that contains the paging token
+    :param next_request_token_key: Name of the request parameter to pass the token key as.
+    :return list:
+    """
+    return list(
+        iter_boto3_paged_results(
+            func, results_key, next_token_key, next_request_token_key, *args, **kwargs
+        )
+    )
 
 
 def check_written_s3(object_name, expected_written_length, written_length):
@@ -308,7 +491,7 @@ def dynamodb_record_to_dict(record: Dict[str, Dict[str, str]]) -> Dict[str, str]
         "baz": "100",
     }
     """
-    return {key: list(value.values())[0] for key, value in record.items()}
+    return {key: next(iter(value.values())) for key, value in record.items()}
 
 
 # pylint: disable=invalid-name
@@ -1,5 +1,12 @@
 """Module for representing S3 URIs"""
-from urllib.parse import urlparse, ParseResult
+import re
+
+# Compiled once at import so each S3URI costs a single match call. The bucket stops at the first
+# `/` or `?`; everything after the slashes that follow it is the key, so `?`s and `#`s in keys survive.
+# https://stackoverflow.com/questions/42641315/s3-urls-get-bucket-name-and-path
+_S3URI_RE = re.compile(
+    r"[A-Za-z][A-Za-z0-9+.-]*://(?P<bucket>[^/?]*)/*(?P<key>.*)", re.DOTALL
+)
 
 
 class S3URI:
@@ -10,27 +17,34 @@ class S3URI:
         Parses a given S3 URI into a bucket and key.
         :param uri: A valid S3 URI. Ex: s3://<bucket>/<key>
         """
-        # allow_fragments handles cases where s3 objects might have `#`s in their key
-        # https://stackoverflow.com/questions/42641315/s3-urls-get-bucket-name-and-path
-        self._parsed: ParseResult = urlparse(url=uri, allow_fragments=False)
+        self._uri = uri
+        if uri.startswith("s3://"):
+            # Fast path for the common case, equivalent to the regex unless the bucket part has a `?`
+            self._bucket, _, key = uri[5:].partition("/")
+            if "?" not in self._bucket:
+                self._key = key.lstrip("/")
+                return
+
+        match = _S3URI_RE.fullmatch(uri)
+        if not match:
+            raise ValueError(f"Not a valid S3 URI: '{uri}'")
+        self._bucket = match.group("bucket")
+        self._key = match.group("key")
 
     @property
     def bucket(self) -> str:
         """The name of the bucket"""
-        return self._parsed.netloc
+        return self._bucket
 
     @property
     def key(self) -> str:
         """The key inside the bucket"""
-        key = self._parsed.path.lstrip("/")
-        if self._parsed.query:
-            key += "?" + self._parsed.query
-        return key
+        return self._key
 
     @property
     def uri(self) -> str:
         """The original URI"""
-        return self._parsed.geturl()
+        return self._uri
 
     def __repr__(self):
         return f"S3URI(uri='{self.uri}')"
@@ -1,4 +1,4 @@
 """Place of record for the package version"""
 
-__version__ = "0.5.2"
+__version__ = "0.6.0"
 __git_hash__ = "GIT_HASH"
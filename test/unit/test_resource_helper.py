@@ -1,6 +1,11 @@
 """
 Tests for resource Helper
 """
+import asyncio
+import random
+from contextlib import ExitStack
+from itertools import repeat
+from typing import Any, Iterable
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
@@ -12,13 +17,17 @@ from amplify_aws_utils.exceptions import (
     ExpectedTimeoutError,
     TimeoutError,
 )
+from amplify_aws_utils.jitter import DecorrelatedJitter, EqualJitter
 from amplify_aws_utils.resource_helper import (
+    _DESCRIBE_CACHE,
     Jitter,
     catchall_exception_lambda_handler_decorator,
     dynamodb_record_to_dict,
     keep_trying,
     throttled_call,
+    wait_for_all_states_boto3,
     wait_for_state_boto3,
+    wait_for_state_boto3_async,
     to_bool,
 )
 
@@ -27,82 +36,195 @@ class MockError(Exception):
     """Exception for testing"""
 
 
-# time.sleep is being patched but not referenced.
-# pylint: disable=unused-argument
+class FlakyFunction:
+    """
+    Lightweight stand-in for MagicMock(side_effect=[...]) in retry loop tests.
+    Each call returns the next result, or raises it if it is an exception.
+    """
+
+    def __init__(self, results: Iterable[Any]):
+        self.call_count = 0
+        self._results = iter(results)
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        result = next(self._results)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
 class ResourceHelperTests(TestCase):
     """Test Resource Helper"""
 
-    @patch("time.sleep", return_value=None)
-    def test_jitter(self, mock_sleep):
+    THROTTLING_ERR = ClientError({"Error": {"Code": "Throttling"}}, "test")
+    MYERROR_ERR = ClientError({"Error": {"Code": "MyError"}}, "test")
+    UNAVAILABLE_ERR = ClientError({"Error": {"Code": "ServiceUnavailable"}}, "test")
+    WAITER_TIMEOUT_ERR = WaiterError(
+        "Timeout", "test", {"Error": {"Code": "Throttling"}}
+    )
+
+    DYNAMODB_RECORD = {
+        "foo": {
+            "S": "bar",
+        },
+        "baz": {
+            "N": "100",
+        },
+    }
+    DYNAMODB_DICT = {
+        "foo": "bar",
+        "baz": "100",
+    }
+    DYNAMODB_TYPED_VALUES = {
+        "S": "bar",
+        "N": "100",
+        "B": b"bar",
+        "BOOL": True,
+        "NULL": True,
+        "SS": ["bar", "baz"],
+        "NS": ["1", "100"],
+        "BS": [b"bar", b"baz"],
+        "L": [{"S": "bar"}, {"N": "100"}],
+        "M": {"baz": {"S": "bar"}},
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        sleep_patcher = patch("time.sleep", return_value=None)
+        cls.mock_sleep = sleep_patcher.start()
+        cls.addClassCleanup(sleep_patcher.stop)
+
+    def setUp(self):
+        self.mock_sleep.reset_mock()
+
+    def test_jitter(self):
         """Test Jitter backoff"""
         min_wait = 3
-        jitter = Jitter(min_wait=min_wait)
-        previous_time_passed = 0
-        while True:
+        jitter = Jitter(min_wait=min_wait, rng=random.Random(0xDEAD))
+        time_passed = 0
+        while time_passed <= 1000:
+            time_passed = jitter.backoff()
+
+        wait_times = [args[0] for args, _ in self.mock_sleep.call_args_list]
+        caps = [
+            min(Jitter.MAX_POLL_INTERVAL, min_wait * 2**attempt)
+            for attempt in range(len(wait_times))
+        ]
+
+        self.assertAlmostEqual(time_passed, sum(wait_times))
+        self.assertEqual(len(wait_times), jitter.attempt)
+        self.assertTrue(all(0 <= wait <= cap for wait, cap in zip(wait_times, caps)))
+
+    def test_jitter_full_jitter_range(self):
+        """Test Jitter draws each interval from zero up to the exponentially growing cap"""
+        rng = MagicMock()
+        rng.uniform.side_effect = lambda low, high: high
+        jitter = Jitter(min_wait=3, rng=rng)
+
+        for _ in range(7):
+            jitter.backoff()
+
+        self.assertEqual(
+            [(0, 3), (0, 6), (0, 12), (0, 24), (0, 48), (0, 60), (0, 60)],
+            [args for args, _ in rng.uniform.call_args_list],
+        )
+
+    def test_jitter_long_running(self):
+        """Test the backoff cap stays bounded for float waits after many attempts"""
+        for jitter_class in (Jitter, EqualJitter):
+            with self.subTest(jitter_class=jitter_class):
+                jitter = jitter_class(min_wait=0.5, rng=random.Random(0xDEAD))
+                jitter._attempt = 1100  # pylint: disable=protected-access
+
+                self.assertLessEqual(jitter.advance(), Jitter.MAX_POLL_INTERVAL)
+
+    def test_decorrelated_jitter(self):
+        """Test DecorrelatedJitter backoff"""
+        min_wait = 3
+        jitter = DecorrelatedJitter(min_wait=min_wait, rng=random.Random(0xDEAD))
+        time_passed = 0
+        while time_passed <= 1000:
             time_passed = jitter.backoff()
-            wait_time = time_passed - previous_time_passed
-            self.assertTrue(wait_time >= min_wait)
-            self.assertTrue(wait_time <= max(min_wait, previous_time_passed * 3))
-            self.assertTrue(wait_time <= Jitter.MAX_POLL_INTERVAL)
-            previous_time_passed = time_passed
-            if time_passed > 1000:
-                break
-
-    @patch("time.sleep", return_value=None)
-    def test_keep_trying_noerr(self, mock_sleep):
+
+        wait_times = [args[0] for args, _ in self.mock_sleep.call_args_list]
+        previous_wait_times = [min_wait] + wait_times[:-1]
+
+        self.assertAlmostEqual(time_passed, sum(wait_times))
+        self.assertTrue(
+            all(min_wait <= wait <= Jitter.MAX_POLL_INTERVAL for wait in wait_times)
+        )
+        self.assertTrue(
+            all(
+                wait <= previous * 3
+                for previous, wait in zip(previous_wait_times, wait_times)
+            )
+        )
+
+    def test_keep_trying_noerr(self):
         """Test keep_trying with no error"""
-        mock_func = MagicMock()
-        mock_func.side_effect = [Exception, Exception, True]
+        mock_func = FlakyFunction([Exception(), Exception(), True])
         keep_trying(10, mock_func)
         self.assertEqual(3, mock_func.call_count)
 
-    @patch("time.sleep", return_value=None)
-    def test_keep_trying_timeout(self, mock_sleep):
+    def test_keep_trying_timeout(self):
         """Test keep_trying with timeout"""
-        mock_func = MagicMock()
-        mock_func.side_effect = Exception
-        self.assertRaises(Exception, keep_trying, 10, mock_func)
+        mock_func = FlakyFunction(repeat(Exception()))
+        with self.assertRaises(Exception):
+            keep_trying(10, mock_func)
 
-    @patch("time.sleep", return_value=None)
-    def test_throttled_call_clienterror_noerr(self, mock_sleep):
+    def test_throttled_call_clienterror_noerr(self):
         """Test throttle_call with no error"""
-        mock_func = MagicMock()
-        error_response = {"Error": {"Code": "Throttling"}}
-        client_error = ClientError(error_response, "test")
-        mock_func.side_effect = [client_error, client_error, True]
+        mock_func = FlakyFunction([self.THROTTLING_ERR, self.THROTTLING_ERR, True])
         throttled_call(mock_func)
         self.assertEqual(3, mock_func.call_count)
 
-    @patch("time.sleep", return_value=None)
-    def test_throttled_call_clienterror_timeout(self, mock_sleep):
+    @patch("random.uniform", return_value=0)
+    def test_throttled_call_equal_jitter(self, mock_uniform):
+        """Test throttle_call waits at least half the backoff cap on throttling errors"""
+        mock_func = FlakyFunction([self.THROTTLING_ERR, self.THROTTLING_ERR, True])
+        throttled_call(mock_func)
+        self.assertEqual(
+            [(0, 1.5), (0, 3.0)], [args for args, _ in mock_uniform.call_args_list]
+        )
+        self.assertEqual(
+            [1.5, 3.0], [args[0] for args, _ in self.mock_sleep.call_args_list]
+        )
+
+    @patch("random.uniform", return_value=0)
+    def test_throttled_call_full_jitter(self, mock_uniform):
+        """Test throttle_call uses full jitter on retryable errors that aren't rate limits"""
+        mock_func = FlakyFunction([self.UNAVAILABLE_ERR, self.UNAVAILABLE_ERR, True])
+        throttled_call(mock_func)
+        self.assertEqual(
+            [(0, 3), (0, 6)], [args for args, _ in mock_uniform.call_args_list]
+        )
+        self.assertEqual(
+            [0, 0], [args[0] for args, _ in self.mock_sleep.call_args_list]
+        )
+
+    @patch("amplify_aws_utils.resource_helper.THROTTLED_CALL_MAX_TIME", 10)
+    def test_throttled_call_clienterror_timeout(self):
         """Test throttle_call with ClientError timeout"""
-        mock_func = MagicMock()
-        error_response = {"Error": {"Code": "Throttling"}}
-        client_error = ClientError(error_response, "test")
-        mock_func.side_effect = client_error
-        self.assertRaises(ClientError, throttled_call, mock_func)
-
-    @patch("time.sleep", return_value=None)
-    def test_throttled_call_waitererror_timeout(self, mock_sleep):
+        mock_func = FlakyFunction(repeat(self.THROTTLING_ERR))
+        with self.assertRaises(ClientError):
+            throttled_call(mock_func)
+
+    @patch("amplify_aws_utils.resource_helper.THROTTLED_CALL_MAX_TIME", 10)
+    def test_throttled_call_waitererror_timeout(self):
         """Test throttle_call with WaiterError timeout"""
-        mock_func = MagicMock()
-        last_response = {"Error": {"Code": "Throttling"}}
-        waiter_error = WaiterError("Timeout", "test", last_response)
-        mock_func.side_effect = waiter_error
-        self.assertRaises(WaiterError, throttled_call, mock_func)
-
-    @patch("time.sleep", return_value=None)
-    def test_throttled_call_clienterror_error(self, mock_sleep):
+        mock_func = FlakyFunction(repeat(self.WAITER_TIMEOUT_ERR))
+        with self.assertRaises(WaiterError):
+            throttled_call(mock_func)
+
+    def test_throttled_call_clienterror_error(self):
         """Test throttle_call with error"""
-        mock_func = MagicMock()
-        error_response = {"Error": {"Code": "MyError"}}
-        client_error = ClientError(error_response, "test")
-        mock_func.side_effect = client_error
-        self.assertRaises(ClientError, throttled_call, mock_func)
+        mock_func = FlakyFunction(repeat(self.MYERROR_ERR))
+        with self.assertRaises(ClientError):
+            throttled_call(mock_func)
         self.assertEqual(1, mock_func.call_count)
 
-    @patch("time.sleep", return_value=None)
-    def test_wait_for_state_boto3_noerr(self, mock_sleep):
+    def test_wait_for_state_boto3_noerr(self):
         """Test wait_for_state_boto3 with no error"""
         mock_describe_func = MagicMock(
             return_value={"myresource": {"status": "available"}}
@@ -117,115 +239,239 @@ class ResourceHelperTests(TestCase):
         )
         self.assertEqual(1, mock_describe_func.call_count)
 
-    @patch("time.sleep", return_value=None)
-    def test_wait_for_state_boto3_timeout(self, mock_sleep):
-        """Test wait_for_state_boto3 with timeout"""
+    def test_wait_for_state_boto3_cache_ttl(self):
+        """Test wait_for_state_boto3 shares describe responses within cache_ttl"""
+        self.addCleanup(_DESCRIBE_CACHE.clear)
         mock_describe_func = MagicMock(
-            return_value={"myresource": {"status": "mystatus"}}
+            return_value={"myresource": {"status": "available"}}
         )
-        self.assertRaises(
-            TimeoutError,
-            wait_for_state_boto3,
+        for _ in range(2):
+            wait_for_state_boto3(
+                mock_describe_func,
+                {"param1": "p1"},
+                "myresource",
+                "available",
+                state_attr="status",
+                timeout=30,
+                cache_ttl=60,
+            )
+        self.assertEqual(1, mock_describe_func.call_count)
+
+        wait_for_state_boto3(
             mock_describe_func,
-            {"param1": "p1"},
+            {"param1": "p2"},
             "myresource",
             "available",
             state_attr="status",
             timeout=30,
+            cache_ttl=60,
         )
+        self.assertEqual(2, mock_describe_func.call_count)
 
-    @patch("time.sleep", return_value=None)
-    def test_wait_for_state_boto3_exp_timeout(self, mock_sleep):
-        """Test wait_for_state_boto3 with ExpectedTimeout"""
+    def test_wait_for_state_boto3_timeout(self):
+        """Test wait_for_state_boto3 with timeout"""
         mock_describe_func = MagicMock(
-            return_value={"myresource": {"status": "failed"}}
+            return_value={"myresource": {"status": "mystatus"}}
         )
-        self.assertRaises(
-            ExpectedTimeoutError,
-            wait_for_state_boto3,
-            mock_describe_func,
-            {"param1": "p1"},
-            "myresource",
-            "available",
-            state_attr="status",
-            timeout=30,
+        with self.assertRaises(TimeoutError):
+            wait_for_state_boto3(
+                mock_describe_func,
+                {"param1": "p1"},
+                "myresource",
+                "available",
+                state_attr="status",
+                timeout=30,
+            )
+
+    @patch("random.uniform", side_effect=lambda low, high: high)
+    def test_wait_for_state_boto3_schedule(self, mock_uniform):
+        """Test wait_for_state_boto3 polls on a decorrelated jitter schedule"""
+        mock_describe_func = MagicMock(
+            return_value={"myresource": {"status": "mystatus"}}
         )
-        self.assertEqual(1, mock_describe_func.call_count)
+        with self.assertRaises(TimeoutError):
+            wait_for_state_boto3(
+                mock_describe_func,
+                {"param1": "p1"},
+                "myresource",
+                "available",
+                state_attr="status",
+                timeout=30,
+            )
 
-        mock_describe_func = MagicMock(
-            return_value={"myresource": {"status": "terminated"}}
+        self.assertEqual(
+            [(3, 9), (3, 27)], [args for args, _ in mock_uniform.call_args_list]
         )
-        self.assertRaises(
-            ExpectedTimeoutError,
-            wait_for_state_boto3,
-            mock_describe_func,
-            {"param1": "p1"},
-            "myresource",
-            "available",
-            state_attr="status",
-            timeout=30,
+        self.assertEqual(
+            [9, 27], [args[0] for args, _ in self.mock_sleep.call_args_list]
         )
-        self.assertEqual(1, mock_describe_func.call_count)
+        self.assertEqual(3, mock_describe_func.call_count)
 
-    @patch("time.sleep", return_value=None)
-    def test_wait_for_state_boto3_clienterror(self, mock_sleep):
+    def test_wait_for_state_boto3_exp_timeout(self):
+        """Test wait_for_state_boto3 with ExpectedTimeout"""
+        for status in ("failed", "terminated"):
+            with self.subTest(status=status):
+                mock_describe_func = MagicMock(
+                    return_value={"myresource": {"status": status}}
+                )
+                with self.assertRaises(ExpectedTimeoutError):
+                    wait_for_state_boto3(
+                        mock_describe_func,
+                        {"param1": "p1"},
+                        "myresource",
+                        "available",
+                        state_attr="status",
+                        timeout=30,
+                    )
+                self.assertEqual(1, mock_describe_func.call_count)
+
+    def test_wait_for_state_boto3_clienterror(self):
         """Test wait_for_state_boto3 with ClientError and returned Timeout"""
         mock_describe_func = MagicMock()
-        error_response = {"Error": {"Code": "MyError"}}
-        mock_describe_func.side_effect = ClientError(error_response, "test")
-        self.assertRaises(
-            TimeoutError,
-            wait_for_state_boto3,
-            mock_describe_func,
-            {"param1": "p1"},
-            "myresource",
-            "available",
-            state_attr="status",
-            timeout=30,
-        )
-
-    @patch("time.sleep", return_value=None)
-    def test_wait_for_state_boto3_error(self, mock_sleep):
+        mock_describe_func.side_effect = self.MYERROR_ERR
+        with self.assertRaises(TimeoutError):
+            wait_for_state_boto3(
+                mock_describe_func,
+                {"param1": "p1"},
+                "myresource",
+                "available",
+                state_attr="status",
+                timeout=30,
+            )
+
+    def test_wait_for_state_boto3_error(self):
         """Test wait_for_state_boto3 with RuntimeError and returned RuntimeError"""
         mock_describe_func = MagicMock()
         mock_describe_func.side_effect = RuntimeError
-        self.assertRaises(
-            RuntimeError,
-            wait_for_state_boto3,
-            mock_describe_func,
-            {"param1": "p1"},
-            "myresource",
-            "available",
-            state_attr="status",
-            timeout=30,
-        )
+        with self.assertRaises(RuntimeError):
+            wait_for_state_boto3(
+                mock_describe_func,
+                {"param1": "p1"},
+                "myresource",
+                "available",
+                state_attr="status",
+                timeout=30,
+            )
         self.assertEqual(1, mock_describe_func.call_count)
 
-    def test_dynamodb_record_to_dict(self):
-        """Test dynamodb_record_to_dict happy"""
-        mock_record = {
-            "foo": {
-                "S": "bar",
-            },
-            "baz": {
-                "N": "100",
-            },
-        }
+    @patch("asyncio.sleep")
+    def test_wait_for_state_boto3_async(self, mock_async_sleep):
+        """Test wait_for_state_boto3_async polls until the resource is ready"""
+        mock_describe_func = MagicMock(
+            side_effect=[
+                {"myresource": {"status": "pending"}},
+                {"myresource": {"status": "available"}},
+            ]
+        )
 
-        expected = {
-            "foo": "bar",
-            "baz": "100",
-        }
+        asyncio.run(
+            wait_for_state_boto3_async(
+                mock_describe_func,
+                {"param1": "p1"},
+                "myresource",
+                "available",
+                state_attr="status",
+            )
+        )
+
+        self.assertEqual(2, mock_describe_func.call_count)
+        self.assertEqual(1, mock_async_sleep.await_count)
+        self.mock_sleep.assert_not_called()
+
+    @patch("asyncio.sleep")
+    def test_wait_for_state_boto3_async_timeout(self, mock_async_sleep):
+        """Test wait_for_state_boto3_async times out like the sync version"""
+        mock_describe_func = MagicMock(
+            return_value={"myresource": {"status": "mystatus"}}
+        )
+        with self.assertRaises(TimeoutError):
+            asyncio.run(
+                wait_for_state_boto3_async(
+                    mock_describe_func,
+                    {"param1": "p1"},
+                    "myresource",
+                    "available",
+                    state_attr="status",
+                    timeout=30,
+                )
+            )
+
+        self.assertEqual(
+            mock_describe_func.call_count, mock_async_sleep.await_count + 1
+        )
 
+    @patch("asyncio.sleep")
+    def test_wait_for_all_states_boto3(self, _):
+        """Test wait_for_all_states_boto3 waits for every set of resources"""
+        mock_describe_funcs = [
+            MagicMock(
+                side_effect=[{"myresource": {"status": "pending"}}] * polls
+                + [{"myresource": {"status": "available"}}]
+            )
+            for polls in (0, 1, 2)
+        ]
+
+        asyncio.run(
+            wait_for_all_states_boto3(
+                {
+                    "describe_func": mock_describe_func,
+                    "params_dict": {"param1": "p1"},
+                    "resources_name": "myresource",
+                    "expected_state": "available",
+                    "state_attr": "status",
+                }
+                for mock_describe_func in mock_describe_funcs
+            )
+        )
+
+        self.assertEqual(
+            [1, 2, 3],
+            [
+                mock_describe_func.call_count
+                for mock_describe_func in mock_describe_funcs
+            ],
+        )
+
+    @patch("asyncio.sleep")
+    def test_wait_for_all_states_boto3_failure(self, _):
+        """Test wait_for_all_states_boto3 raises the first failure"""
+        specs = [
+            {
+                "describe_func": MagicMock(
+                    return_value={"myresource": {"status": status}}
+                ),
+                "params_dict": {"param1": "p1"},
+                "resources_name": "myresource",
+                "expected_state": "available",
+                "state_attr": "status",
+            }
+            for status in ("pending", "failed")
+        ]
+
+        with self.assertRaises(ExpectedTimeoutError):
+            asyncio.run(wait_for_all_states_boto3(specs))
+
+    def test_dynamodb_record_to_dict(self):
+        """Test dynamodb_record_to_dict happy"""
         actual = dynamodb_record_to_dict(
-            record=mock_record,
+            record=self.DYNAMODB_RECORD,
         )
 
         self.assertEqual(
-            expected,
+            self.DYNAMODB_DICT,
             actual,
         )
 
+    def test_dynamodb_record_to_dict_types(self):
+        """Test dynamodb_record_to_dict unwraps every DynamoDB type descriptor"""
+        for type_code, value in self.DYNAMODB_TYPED_VALUES.items():
+            with self.subTest(type_code=type_code):
+                actual = dynamodb_record_to_dict(
+                    record={"foo": {type_code: value}},
+                )
+
+                self.assertEqual({"foo": value}, actual)
+
     def test_to_bool(self):
         """Test to_bool happy"""
         # true values
@@ -246,15 +492,23 @@ class ResourceHelperTests(TestCase):
         self.assertEqual(to_bool("False"), False)
 
 
-# aws_lambda_powertools.middleware_factory.factory.logger is being patched but not referenced.
-# pylint: disable=unused-argument,no-value-for-parameter
+# pylint: disable=no-value-for-parameter
 class CatchallExceptionLambdaHandlerDecoratorTests(TestCase):
     """Test amplify_aws_utils.resource_helper.catchall_exception_lambda_handler_decorator()"""
 
+    def setUp(self):
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        # silence the aws_lambda_powertools middleware logging, it is not asserted on
+        stack.enter_context(
+            patch("aws_lambda_powertools.middleware_factory.factory.logger")
+        )
+        self.mock_logger = stack.enter_context(
+            patch("amplify_aws_utils.resource_helper.logger")
+        )
+
     # pylint: disable=assignment-from-no-return
-    @patch("aws_lambda_powertools.middleware_factory.factory.logger")
-    @patch("amplify_aws_utils.resource_helper.logger")
-    def test_no_raise_exception(self, mock_logger, mock_aws_lambda_powertools_logger):
+    def test_no_raise_exception(self):
         """Tests catchall_exception_lambda_handler_decorator, doesn't raise exception, does log exception"""
 
         @catchall_exception_lambda_handler_decorator(raise_exception=False)
@@ -263,12 +517,10 @@ class CatchallExceptionLambdaHandlerDecoratorTests(TestCase):
 
         actual_response = _lambda_handler({}, MagicMock)
 
-        mock_logger.exception.assert_called_once_with("Catchall exception logging")
+        self.mock_logger.exception.assert_called_once_with("Catchall exception logging")
         self.assertEqual(actual_response, None)
 
-    @patch("aws_lambda_powertools.middleware_factory.factory.logger")
-    @patch("amplify_aws_utils.resource_helper.logger")
-    def test_no_log_exception(self, mock_logger, mock_aws_lambda_powertools_logger):
+    def test_no_log_exception(self):
         """Tests catchall_exception_lambda_handler_decorator, doesn't log exception, does raise exception"""
 
         @catchall_exception_lambda_handler_decorator(log_exception=False)
@@ -279,13 +531,9 @@ class CatchallExceptionLambdaHandlerDecoratorTests(TestCase):
             _lambda_handler({}, MagicMock)
 
         self.assertRegex(str(context.exception), "some exception")
-        mock_logger.exception.assert_not_called()
+        self.mock_logger.exception.assert_not_called()
 
-    @patch("aws_lambda_powertools.middleware_factory.factory.logger")
-    @patch("amplify_aws_utils.resource_helper.logger")
-    def test_no_raise_no_log_exception(
-        self, mock_logger, mock_aws_lambda_powertools_logger
-    ):
+    def test_no_raise_no_log_exception(self):
         """
         Tests catchall_exception_lambda_handler_decorator, doesn't raise exception, doesn't log exception
         """
@@ -298,14 +546,10 @@ class CatchallExceptionLambdaHandlerDecoratorTests(TestCase):
 
         actual_response = _lambda_handler({}, MagicMock)
 
-        mock_logger.exception.assert_not_called()
+        self.mock_logger.exception.assert_not_called()
         self.assertEqual(actual_response, None)
 
-    @patch("aws_lambda_powertools.middleware_factory.factory.logger")
-    @patch("amplify_aws_utils.resource_helper.logger")
-    def test_exception_chaining_in_err_mssg(
-        self, mock_logger, mock_aws_lambda_powertools_logger
-    ):
+    def test_exception_chaining_in_err_mssg(self):
         """
         Tests catchall_exception_lambda_handler_decorator correctly retains exception chaining
         in exception error message
@@ -327,10 +571,9 @@ class CatchallExceptionLambdaHandlerDecoratorTests(TestCase):
         self.assertRegex(str(context.exception), "some exception 1")
         self.assertRegex(str(context.exception), "some exception 2")
 
-        mock_logger.exception.assert_called_once_with("Catchall exception logging")
+        self.mock_logger.exception.assert_called_once_with("Catchall exception logging")
 
-    @patch("amplify_aws_utils.resource_helper.logger")
-    def test_wrap_response(self, mock_logger):
+    def test_wrap_response(self):
         """Tests catchall_exception_lambda_handler_decorator correctly wraps the response"""
         mock_response = {
             "foo": "bar",
@@ -345,4 +588,4 @@ class CatchallExceptionLambdaHandlerDecoratorTests(TestCase):
 
         self.assertEqual(actual_response, mock_response)
 
-        mock_logger.exception.assert_not_called()
+        self.mock_logger.exception.assert_not_called()
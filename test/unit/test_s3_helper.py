@@ -2,9 +2,10 @@
 # pylint: disable=deprecated-module
 import hashlib
 import random
+import secrets
 import string
 from io import BytesIO
-from typing import Dict, Set
+from typing import Dict, Iterator, Set
 from unittest import TestCase
 from unittest.mock import MagicMock
 from urllib.parse import urlencode
@@ -12,17 +13,17 @@ from urllib.parse import urlencode
 import boto3
 from mypy_boto3_s3.client import S3Client
 from moto import mock_s3
+from moto.core import DEFAULT_ACCOUNT_ID
+from moto.s3.models import s3_backends
 
 from amplify_aws_utils.clients.s3 import S3
+from amplify_aws_utils.exceptions import S3BulkWriteError
 from amplify_aws_utils.resource_helper import boto3_tags_to_dict, dict_to_boto3_tags
 
 TEST_BUCKET_NAME = "test-bucket-name"
-TEST_OBJECT_PREFIX = "".join(
-    random.choices(string.ascii_uppercase + string.digits, k=20)
-)
-TEST_OBJECT_BODY = "".join(
-    random.choices(string.ascii_uppercase + string.digits, k=4000)
-)
+TEST_OBJECT_PREFIX = secrets.token_hex(10)
+TEST_OBJECT_BODY = secrets.token_hex(2000)
+TEST_OBJECT_BODY_BYTES = TEST_OBJECT_BODY.encode("utf-8")
 TEST_OBJECT_KEY_DUPLICATES = f"{TEST_OBJECT_PREFIX}/multiple_versions"
 TEST_OBJECT_KEY_NO_DUPLICATES = f"{TEST_OBJECT_PREFIX}/single_version"
 TEST_OBJECT_KEYS: Set[str] = set()
@@ -33,17 +34,27 @@ TEST_BUCKET_TAGS: Dict[str, str] = {}
 class TestS3Helper(TestCase):
     """Class for testing S3 Helper"""
 
+    client: S3Client
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_s3 = mock_s3()
+        cls.mock_s3.start()
+        cls.client = boto3.client("s3")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mock_s3.stop()
+
     def setUp(self):
-        self.mock_s3 = mock_s3()
-        self.mock_s3.start()
-        client: S3Client = boto3.client("s3")
-        self.setup_environment(client)
-        self.helper = S3(client)
+        self.setup_environment(self.client)
+        self.object_keys = tuple(TEST_OBJECT_KEYS)
+        self.helper = S3(self.client)
 
     def tearDown(self):
         TEST_OBJECT_KEYS.clear()
         TEST_BUCKET_TAGS.clear()
-        self.mock_s3.stop()
+        s3_backends[DEFAULT_ACCOUNT_ID]["global"].reset()
 
     @staticmethod
     def setup_environment(client):
@@ -61,27 +72,27 @@ class TestS3Helper(TestCase):
             Bucket=TEST_BUCKET_NAME, VersioningConfiguration={"Status": "Enabled"}
         )
 
-        # pylint: disable=unused-variable
-        for i in range(10):
-            identifier = "".join(
-                random.choices(string.ascii_uppercase + string.digits, k=10)
-            )
-            key = f"{TEST_OBJECT_PREFIX}/{identifier}"
-            client.put_object(Bucket=TEST_BUCKET_NAME, Key=key, Body=TEST_OBJECT_BODY)
-            TEST_OBJECT_KEYS.add(key)
+        keys = [f"{TEST_OBJECT_PREFIX}/{secrets.token_hex(5)}" for _ in range(10)]
+        TEST_OBJECT_KEYS.update(keys)
+
+        S3(client).put_objects_bulk(
+            bucket=TEST_BUCKET_NAME,
+            items=[(key, TEST_OBJECT_BODY_BYTES) for key in keys],
+        )
 
+        # versions of one key race each other in moto, so write them one at a time
         # pylint: disable=unused-variable
         for i in range(10):
             client.put_object(
                 Bucket=TEST_BUCKET_NAME,
                 Key=TEST_OBJECT_KEY_DUPLICATES,
-                Body=TEST_OBJECT_BODY,
+                Body=TEST_OBJECT_BODY_BYTES,
             )
 
         client.put_object(
             Bucket=TEST_BUCKET_NAME,
             Key=TEST_OBJECT_KEY_NO_DUPLICATES,
-            Body=TEST_OBJECT_BODY,
+            Body=TEST_OBJECT_BODY_BYTES,
             Tagging=urlencode(TEST_OBJECT_TAGS),
         )
 
@@ -98,6 +109,46 @@ class TestS3Helper(TestCase):
 
         self.assertEqual(TEST_OBJECT_KEYS, {item["Key"] for item in items})
 
+    def test_tear_down_clears_bucket(self):
+        """Test that objects written by one test are gone by the next"""
+        self.helper.write_file(
+            bucket=TEST_BUCKET_NAME, key=f"{TEST_OBJECT_PREFIX}/leftover", body=""
+        )
+
+        self.tearDown()
+        self.setUp()
+
+        items = self.helper.list_objects(
+            bucket=TEST_BUCKET_NAME, prefix=TEST_OBJECT_PREFIX
+        )
+        self.assertEqual(TEST_OBJECT_KEYS, {item["Key"] for item in items})
+
+    def test_list_objects_paged(self):
+        """Test that we can list objects spread across multiple pages"""
+        items = self.helper.list_objects(
+            bucket=TEST_BUCKET_NAME, prefix=TEST_OBJECT_PREFIX, MaxKeys=5
+        )
+
+        self.assertEqual(TEST_OBJECT_KEYS, {item["Key"] for item in items})
+
+    def test_iter_objects(self):
+        """Test that we can lazily iterate over objects"""
+        items = self.helper.iter_objects(
+            bucket=TEST_BUCKET_NAME, prefix=TEST_OBJECT_PREFIX, MaxKeys=5
+        )
+
+        self.assertIsInstance(items, Iterator)
+        self.assertEqual(TEST_OBJECT_KEYS, {item["Key"] for item in items})
+
+    def test_iter_versions(self):
+        """Test that we can lazily iterate over versions of objects"""
+        versions = self.helper.iter_versions(
+            bucket=TEST_BUCKET_NAME, prefix=TEST_OBJECT_PREFIX
+        )
+
+        self.assertIsInstance(versions, Iterator)
+        self.assertEqual(len(TEST_OBJECT_KEYS) + 9, len(list(versions)))
+
     def test_list_versions(self):
         """Test that we can list versions of objects"""
         versions = self.helper.list_versions(
@@ -131,7 +182,7 @@ class TestS3Helper(TestCase):
 
     def test_read_file(self):
         """Test that we can read a file"""
-        key = random.choice(tuple(TEST_OBJECT_KEYS))
+        key = random.choice(self.object_keys)
 
         contents = self.helper.read_file(bucket=TEST_BUCKET_NAME, key=key)
 
@@ -141,7 +192,7 @@ class TestS3Helper(TestCase):
         """Test that we can download a file"""
         mock_s3_client = MagicMock()
         self.helper.s3 = mock_s3_client
-        key = random.choice(tuple(TEST_OBJECT_KEYS))
+        key = random.choice(self.object_keys)
         file_obj = BytesIO()
 
         self.helper.download_file(
@@ -168,6 +219,41 @@ class TestS3Helper(TestCase):
 
         self.assertEqual(body, contents)
 
+    def test_put_objects_bulk(self):
+        """Test that we can write many files at once"""
+        items = {f"BULK_{i}": f"BULK_BODY_{i}" for i in range(5)}
+
+        self.helper.put_objects_bulk(
+            bucket=TEST_BUCKET_NAME, items=items.items(), max_workers=2
+        )
+
+        for key, body in items.items():
+            contents = self.helper.read_file(bucket=TEST_BUCKET_NAME, key=key)
+            self.assertEqual(body, contents)
+
+    def test_put_objects_bulk_failures(self):
+        """Test that every failed write is reported once all writes have finished"""
+        error = RuntimeError("put failed")
+
+        def put_object(Key, **kwargs):  # pylint: disable=invalid-name,unused-argument
+            if Key.startswith("BAD_"):
+                raise error
+            return {}
+
+        client = MagicMock()
+        client.put_object.side_effect = put_object
+        helper = S3(client)
+
+        with self.assertRaises(S3BulkWriteError) as context:
+            helper.put_objects_bulk(
+                bucket=TEST_BUCKET_NAME,
+                items=[("GOOD_0", "body"), ("BAD_0", "body"), ("BAD_1", "body")],
+                max_workers=2,
+            )
+
+        self.assertEqual({"BAD_0": error, "BAD_1": error}, context.exception.errors)
+        self.assertEqual(3, client.put_object.call_count)
+
     def test_tag_bucket(self):
         """Test that we can tag a bucket"""
         artifact = "".join(random.choices(string.ascii_uppercase + string.digits, k=10))
@@ -178,8 +264,7 @@ class TestS3Helper(TestCase):
 
         self.helper.put_bucket_tags(bucket=TEST_BUCKET_NAME, tags=tags)
 
-        client = boto3.client("s3")
-        response = client.get_bucket_tagging(Bucket=TEST_BUCKET_NAME)
+        response = self.client.get_bucket_tagging(Bucket=TEST_BUCKET_NAME)
         test_tags = boto3_tags_to_dict(response["TagSet"])
 
         self.assertEqual(tags, test_tags)
@@ -192,8 +277,7 @@ class TestS3Helper(TestCase):
 
         self.helper.put_bucket_tags(bucket=TEST_BUCKET_NAME, tags=tags, merge=True)
 
-        client = boto3.client("s3")
-        response = client.get_bucket_tagging(Bucket=TEST_BUCKET_NAME)
+        response = self.client.get_bucket_tagging(Bucket=TEST_BUCKET_NAME)
         test_tags = boto3_tags_to_dict(response["TagSet"])
         tags.update(TEST_BUCKET_TAGS)
 
@@ -201,16 +285,39 @@ class TestS3Helper(TestCase):
 
     def test_hash_file(self):
         """Test that we can hash a file"""
-        expected_hash_value = hashlib.sha256(
-            TEST_OBJECT_BODY.encode("utf-8")
-        ).hexdigest()
+        expected_hash_value = hashlib.sha256(TEST_OBJECT_BODY_BYTES).hexdigest()
 
         actual_hash_value = self.helper.hash_file(
-            bucket=TEST_BUCKET_NAME, key=random.choice(tuple(TEST_OBJECT_KEYS))
+            bucket=TEST_BUCKET_NAME, key=random.choice(self.object_keys)
         )
 
         self.assertEqual(expected_hash_value, actual_hash_value)
 
+    def test_hash_file_algorithm(self):
+        """Test that we can hash a file with a non-default algorithm"""
+        expected_hash_value = hashlib.blake2b(TEST_OBJECT_BODY_BYTES).hexdigest()
+
+        actual_hash_value = self.helper.hash_file(
+            bucket=TEST_BUCKET_NAME,
+            key=random.choice(self.object_keys),
+            algorithm="blake2b",
+        )
+
+        self.assertEqual(expected_hash_value, actual_hash_value)
+
+    def test_hash_file_multiple_blocks(self):
+        """Test that we can hash a file larger than a single read block"""
+        body = b"0123456789ABCDEF" * 400_000  # 6.4 megabytes
+        mock_s3_client = MagicMock()
+        mock_s3_client.get_object.return_value = {"Body": BytesIO(body)}
+        self.helper.s3 = mock_s3_client
+
+        actual_hash_value = self.helper.hash_file(
+            bucket=TEST_BUCKET_NAME, key="MULTI_BLOCK_OBJECT"
+        )
+
+        self.assertEqual(hashlib.sha256(body).hexdigest(), actual_hash_value)
+
     def test_copy_file(self):
         """Test that we can copy a file"""
         source_key = "COPY_SOURCE"
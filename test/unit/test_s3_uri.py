@@ -69,3 +69,27 @@ class TestS3URI(TestCase):
             uri,
             s3_uri.uri,
         )
+
+    def test_with_query_and_hash(self):
+        """S3URI with both query and hash characters in a nested key"""
+        s3_uri = S3URI(uri="s3://MOCK_BUCKET/MOCK/PREFIX/MOCK_KEY?FOO=BAR#MOCK_HASH")
+
+        self.assertEqual("MOCK_BUCKET", s3_uri.bucket)
+        self.assertEqual("MOCK/PREFIX/MOCK_KEY?FOO=BAR#MOCK_HASH", s3_uri.key)
+
+    def test_invalid(self):
+        """S3URI rejects strings without a scheme"""
+        with self.assertRaises(ValueError):
+            S3URI(uri="MOCK_BUCKET/MOCK_KEY")
+
+    def test_other_scheme(self):
+        """S3URI parses URIs outside the s3:// fast path"""
+        for uri, bucket, key in (
+            ("s3a://MOCK_BUCKET//MOCK_KEY", "MOCK_BUCKET", "MOCK_KEY"),
+            ("s3://MOCK_BUCKET?MOCK_QUERY=BAR", "MOCK_BUCKET", "?MOCK_QUERY=BAR"),
+        ):
+            with self.subTest(uri=uri):
+                s3_uri = S3URI(uri=uri)
+
+                self.assertEqual(bucket, s3_uri.bucket)
+                self.assertEqual(key, s3_uri.key)
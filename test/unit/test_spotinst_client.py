@@ -1,5 +1,5 @@
 """Module for testing our Spotinst client"""
-
+import json
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -9,227 +9,299 @@ import requests_mock
 from requests.exceptions import ReadTimeout, ConnectTimeout, ConnectionError
 
 from amplify_aws_utils.clients.spotinst import (
+    SpotinstApiException,
     SpotinstClient,
     SpotinstRateExceededException,
 )
 
+GROUP_URL = SpotinstClient.GROUP_URL
+# The request envelope the Spotinst API echoes back for a roll of sig-5af12785
+ROLL_REQUEST = {
+    "id": "3213e42e-455e-4901-a185-cc3eb65fac5f",
+    "url": "/aws/ec2/group/sig-5af12785/roll",
+    "method": "PUT",
+    "time": "2016-02-10T15:49:11.911Z",
+}
+# Large response bodies are encoded once here rather than by requests_mock on every request
+JSON_HEADERS = {"Content-Type": "application/json"}
+FINISHED_DEPLOYMENT = {
+    "id": "sbgd-c47a527a",
+    "status": "finished",
+    "progress": {"unit": "percent", "value": 100},
+    "createdAt": "2017-05-24T12:12:39.000+0000",
+    "updatedAt": "2017-05-24T12:19:17.000+0000",
+}
+DELETE_GROUP_BODY = json.dumps(
+    {
+        "request": {
+            "id": "4a0d5084-0b41-4255-82e5-d64a8232d7cc",
+            "url": "/aws/ec2/group/sig-5af12785",
+            "method": "DELETE",
+            "time": "2015-06-28T15:52:45.772Z",
+        },
+        "response": {"status": {"code": 200, "message": "OK"}},
+    }
+)
+ROLL_GROUP_BODY = json.dumps(
+    {
+        "request": ROLL_REQUEST,
+        "response": {
+            "status": {"code": 200, "message": "OK"},
+            "kind": "spotinst:aws:ec2:group:roll",
+        },
+    }
+)
+DEPLOYMENTS_BODY = json.dumps(
+    {
+        "request": ROLL_REQUEST,
+        "response": {
+            "items": [
+                FINISHED_DEPLOYMENT,
+                {
+                    "id": "sbgd-f789ec37",
+                    "status": "in_progress",
+                    "progress": {"unit": "percent", "value": 0},
+                    "createdAt": "2017-05-24T20:13:37.000+0000",
+                    "updatedAt": "2017-05-24T20:15:17.000+0000",
+                },
+            ],
+            "count": 2,
+        },
+    }
+)
+ROLL_STATUS_BODY = json.dumps(
+    {
+        "request": ROLL_REQUEST,
+        "response": {"items": [FINISHED_DEPLOYMENT], "count": 1},
+    }
+)
+# Every kind of transient failure the client retries, followed by a success
+RETRY_RESPONSES = (
+    {"status_code": 429},
+    {"exc": ReadTimeout},
+    {
+        "status_code": 400,
+        "json": {
+            "request": {"id": "b4415046-bb2d-4338-9b8a-73a405a6fe0c"},
+            "response": {
+                "status": "",
+                "errors": [
+                    {
+                        "message": "Cant validate AMI",
+                        "code": "CANT_VALIDATE_IMAGE",
+                    },
+                    {
+                        "message": "Request limit exceeded",
+                        "code": "RequestLimitExceeded",
+                    },
+                ],
+            },
+        },
+    },
+    {"exc": ConnectTimeout},
+    {"exc": ConnectionError},
+    {"json": {"response": {"items": [{"name": "foo"}]}}},
+)
+# Failures that keep the client retrying until it gives up
+RETRY_EXHAUSTED_RESPONSES = ({"status_code": 429}, {"exc": ReadTimeout})
+
+# Installed once for the whole module, each test resets it in setUp
+REQUESTS_MOCKER = requests_mock.Mocker()
+
+
+def setUpModule():  # pylint: disable=invalid-name
+    """Install the requests mocker for every test in this module"""
+    REQUESTS_MOCKER.start()
+
+
+def tearDownModule():  # pylint: disable=invalid-name
+    """Remove the requests mocker"""
+    REQUESTS_MOCKER.stop()
+
 
 class TestSpotinstClient(TestCase):
     """Class for testing Spotinst Client"""
 
+    requests = REQUESTS_MOCKER
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sleeper = MagicMock()
+        cls.spotinst_client = SpotinstClient("", "", sleeper=cls.sleeper)
+
     def setUp(self):
         """Pretest setup"""
-        self.session = MagicMock()
-        self.spotinst_client = SpotinstClient("", "")
+        self.sleeper.reset_mock()
+        # Clears request_history but leaves matchers from earlier tests registered, so shadow
+        # them all with a catch-all; the URLs this test registers later still win.
+        self.requests.reset()
+        self.requests.register_uri(
+            requests_mock.ANY, requests_mock.ANY, status_code=404, text="unmocked"
+        )
+        # pylint: disable=protected-access
+        self.spotinst_client._session.cookies.clear()
 
-    @requests_mock.mock()
-    def test_create_group(self, requests):
+    def _assert_one_call(self, matcher):
+        """Asserts a registered URL was requested exactly once during this test"""
+        self.assertEqual(1, matcher.call_count)
+
+    def test_create_group(self):
         """Test sending create group request"""
-        requests.post(
-            "https://api.spotinst.io/aws/ec2/group",
+        matcher = self.requests.post(
+            GROUP_URL,
             json={"response": {"items": [{"name": "foo"}]}},
         )
 
         result = self.spotinst_client.create_group({"group": {"name": "foo"}})
 
-        self.assertEqual(len(requests.request_history), 1)
+        self._assert_one_call(matcher)
         self.assertEqual(result, {"name": "foo"})
 
-    @requests_mock.mock()
-    def test_update_group(self, requests):
+    def test_update_group(self):
         """Test sending update group request"""
-        requests.put(
-            "https://api.spotinst.io/aws/ec2/group/sig-5af12785",
+        matcher = self.requests.put(
+            f"{GROUP_URL}/sig-5af12785",
             json={"response": {"items": [{"group": {"name:": "foo"}}]}},
         )
 
         self.spotinst_client.update_group("sig-5af12785", {"group": {"name": "foo"}})
 
-        self.assertEqual(len(requests.request_history), 1)
+        self._assert_one_call(matcher)
 
-    @requests_mock.mock()
-    def test_get_groups(self, requests):
+    def test_get_groups(self):
         """Test sending group list request"""
-        requests.get(
-            "https://api.spotinst.io/aws/ec2/group",
+        matcher = self.requests.get(
+            GROUP_URL,
             json={"response": {"items": [{"instanceId": "i-abcd1234"}]}},
         )
 
         self.spotinst_client.get_groups()
 
-        self.assertEqual(len(requests.request_history), 1)
+        self._assert_one_call(matcher)
 
-    @requests_mock.mock()
-    def test_delete_group(self, requests):
+    def test_delete_group(self):
         """Test sending delete group request"""
-        requests.delete(
-            "https://api.spotinst.io/aws/ec2/group/sig-5af12785",
-            json={
-                "request": {
-                    "id": "4a0d5084-0b41-4255-82e5-d64a8232d7cc",
-                    "url": "/aws/ec2/group/sig-5af12785",
-                    "method": "DELETE",
-                    "time": "2015-06-28T15:52:45.772Z",
-                },
-                "response": {"status": {"code": 200, "message": "OK"}},
-            },
+        matcher = self.requests.delete(
+            f"{GROUP_URL}/sig-5af12785",
+            text=DELETE_GROUP_BODY,
+            headers=JSON_HEADERS,
         )
 
         self.spotinst_client.delete_group("sig-5af12785")
 
-        self.assertEqual(len(requests.request_history), 1)
+        self._assert_one_call(matcher)
 
-    @requests_mock.mock()
-    def test_roll_group(self, requests):
+    def test_roll_group(self):
         """Test sending roll group request"""
-        requests.put(
-            "https://api.spotinst.io/aws/ec2/group/sig-5af12785/roll",
-            json={
-                "request": {
-                    "id": "3213e42e-455e-4901-a185-cc3eb65fac5f",
-                    "url": "/aws/ec2/group/sig-5af12785/roll",
-                    "method": "PUT",
-                    "time": "2016-02-10T15:49:11.911Z",
-                },
-                "response": {
-                    "status": {"code": 200, "message": "OK"},
-                    "kind": "spotinst:aws:ec2:group:roll",
-                },
-            },
+        matcher = self.requests.put(
+            f"{GROUP_URL}/sig-5af12785/roll",
+            text=ROLL_GROUP_BODY,
+            headers=JSON_HEADERS,
         )
 
         self.spotinst_client.roll_group(
             "sig-5af12785", 100, 100, health_check_type="EC2"
         )
 
-        self.assertEqual(len(requests.request_history), 1)
+        self._assert_one_call(matcher)
 
-    @requests_mock.mock()
-    def test_get_deployments(self, requests):
+    def test_get_deployments(self):
         """Test getting a list of deployments for a group"""
-        requests.get(
-            "https://api.spotinst.io/aws/ec2/group/sig-5af12785/roll",
-            json={
-                "request": {
-                    "id": "3213e42e-455e-4901-a185-cc3eb65fac5f",
-                    "url": "/aws/ec2/group/sig-5af12785/roll",
-                    "method": "PUT",
-                    "time": "2016-02-10T15:49:11.911Z",
-                },
-                "response": {
-                    "items": [
-                        {
-                            "id": "sbgd-c47a527a",
-                            "status": "finished",
-                            "progress": {"unit": "percent", "value": 100},
-                            "createdAt": "2017-05-24T12:12:39.000+0000",
-                            "updatedAt": "2017-05-24T12:19:17.000+0000",
-                        },
-                        {
-                            "id": "sbgd-f789ec37",
-                            "status": "in_progress",
-                            "progress": {"unit": "percent", "value": 0},
-                            "createdAt": "2017-05-24T20:13:37.000+0000",
-                            "updatedAt": "2017-05-24T20:15:17.000+0000",
-                        },
-                    ],
-                    "count": 2,
-                },
-            },
+        matcher = self.requests.get(
+            f"{GROUP_URL}/sig-5af12785/roll",
+            text=DEPLOYMENTS_BODY,
+            headers=JSON_HEADERS,
         )
 
         deployments = self.spotinst_client.get_deployments("sig-5af12785")
 
-        self.assertEqual(len(requests.request_history), 1)
+        self._assert_one_call(matcher)
         self.assertEqual(len(deployments), 2)
 
-    @requests_mock.mock()
-    def test_get_roll_status(self, requests):
+    def test_get_roll_status(self):
         """Test getting the status of a deployment"""
-        requests.get(
-            "https://api.spotinst.io/aws/ec2/group/sig-5af12785/roll/sbgd-c47a527a",
+        matcher = self.requests.get(
+            f"{GROUP_URL}/sig-5af12785/roll/sbgd-c47a527a",
+            text=ROLL_STATUS_BODY,
+            headers=JSON_HEADERS,
+        )
+
+        status = self.spotinst_client.get_roll_status("sig-5af12785", "sbgd-c47a527a")
+
+        self._assert_one_call(matcher)
+        self.assertEqual(status["status"], "finished")
+
+    def test_session_reuse(self):
+        """Test that every request goes through the client's pooled session"""
+        matcher = self.requests.get(
+            GROUP_URL,
+            json={"response": {"items": [{"instanceId": "i-abcd1234"}]}},
+        )
+        # pylint: disable=protected-access
+        session = self.spotinst_client._session
+
+        with patch.object(session, "send", wraps=session.send) as mock_send:
+            self.spotinst_client.get_groups()
+            self.spotinst_client.get_groups()
+
+        self.assertEqual(2, mock_send.call_count)
+        self.assertEqual(2, matcher.call_count)
+
+    def test_retries_exhausted(self):
+        """Test a persistent throttle or timeout is raised once the backoff runs out"""
+        for response in RETRY_EXHAUSTED_RESPONSES:
+            with self.subTest(response=response):
+                self.sleeper.reset_mock()
+                self.requests.get(GROUP_URL, **response)
+
+                with self.assertRaises(SpotinstRateExceededException):
+                    self.spotinst_client.get_groups()
+
+                self.sleeper.assert_called()
+
+    def test_unrecoverable_400(self):
+        """Test an error response without a rate limit code is raised without retrying"""
+        matcher = self.requests.get(
+            GROUP_URL,
+            status_code=400,
             json={
-                "request": {
-                    "id": "3213e42e-455e-4901-a185-cc3eb65fac5f",
-                    "url": "/aws/ec2/group/sig-5af12785/roll",
-                    "method": "PUT",
-                    "time": "2016-02-10T15:49:11.911Z",
-                },
+                "request": {"id": "b4415046-bb2d-4338-9b8a-73a405a6fe0c"},
                 "response": {
-                    "items": [
-                        {
-                            "id": "sbgd-c47a527a",
-                            "status": "finished",
-                            "progress": {"unit": "percent", "value": 100},
-                            "createdAt": "2017-05-24T12:12:39.000+0000",
-                            "updatedAt": "2017-05-24T12:19:17.000+0000",
-                        }
+                    "status": "",
+                    "errors": [
+                        {"message": "Cant validate AMI", "code": "CANT_VALIDATE_IMAGE"}
                     ],
-                    "count": 1,
                 },
             },
         )
 
-        status = self.spotinst_client.get_roll_status("sig-5af12785", "sbgd-c47a527a")
-
-        self.assertEqual(len(requests.request_history), 1)
-        self.assertEqual(status["status"], "finished")
+        with self.assertRaises(SpotinstApiException):
+            self.spotinst_client.get_groups()
 
-    # pylint: disable=unused-argument
-    @requests_mock.mock()
-    @patch("time.sleep", return_value=None)
-    def test_throttle_error(self, requests, sleep_mock):
-        """Test handling spotinst throttling"""
-        requests.get("https://api.spotinst.io/aws/ec2/group", status_code=429)
+        self._assert_one_call(matcher)
+        self.sleeper.assert_not_called()
 
-        self.assertRaises(
-            SpotinstRateExceededException, self.spotinst_client.get_groups
+    def test_retry_server_error(self):
+        """Test a transient server error is retried even without a JSON body"""
+        matcher = self.requests.get(
+            GROUP_URL,
+            [
+                {"status_code": 503, "text": "Service Unavailable"},
+                {"json": {"response": {"items": [{"name": "foo"}]}}},
+            ],
         )
 
-    # pylint: disable=unused-argument
-    @requests_mock.mock()
-    @patch("time.sleep", return_value=None)
-    def test_timeout_error(self, requests, sleep_mock):
-        """Test handling a request timeout"""
-        requests.get("https://api.spotinst.io/aws/ec2/group", exc=ReadTimeout)
+        groups = self.spotinst_client.get_groups()
 
-        self.assertRaises(
-            SpotinstRateExceededException, self.spotinst_client.get_groups
-        )
+        self.assertEqual([{"name": "foo"}], groups)
+        self.assertEqual(2, matcher.call_count)
+        self.sleeper.assert_called_once()
 
-    # pylint: disable=unused-argument
-    @requests_mock.mock()
-    @patch("time.sleep", return_value=None)
-    def test_retry(self, requests, sleep_mock):
+    def test_retry(self):
         """Test request keeps retrying until successful"""
-        responses = [
-            {"status_code": 429},
-            {"exc": ReadTimeout},
-            {
-                "status_code": 400,
-                "json": {
-                    "request": {"id": "b4415046-bb2d-4338-9b8a-73a405a6fe0c"},
-                    "response": {
-                        "status": "",
-                        "errors": [
-                            {
-                                "message": "Cant validate AMI",
-                                "code": "CANT_VALIDATE_IMAGE",
-                            },
-                            {
-                                "message": "Request limit exceeded",
-                                "code": "RequestLimitExceeded",
-                            },
-                        ],
-                    },
-                },
-            },
-            {"exc": ConnectTimeout},
-            {"exc": ConnectionError},
-            {"json": {"response": {"items": [{"name": "foo"}]}}},
-        ]
-        requests.get("https://api.spotinst.io/aws/ec2/group", responses)
+        self.requests.get(GROUP_URL, list(RETRY_RESPONSES))
 
         groups = self.spotinst_client.get_groups()
 
         self.assertEqual([{"name": "foo"}], groups)
+        self.assertEqual(5, self.sleeper.call_count)
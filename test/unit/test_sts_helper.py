@@ -1,6 +1,6 @@
 """Test STS helper"""
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 from amplify_aws_utils.clients.sts import STS
 
@@ -8,26 +8,39 @@ from amplify_aws_utils.clients.sts import STS
 class TestSTSHelper(TestCase):
     """Test STS helper"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.sts_client = MagicMock()
+        cls.sts_helper = STS(cls.sts_client)
+        boto3_patcher = patch("amplify_aws_utils.clients.sts.boto3.client")
+        cls.boto3_mock = boto3_patcher.start()
+        cls.addClassCleanup(boto3_patcher.stop)
+
     def setUp(self):
-        self.sts_client = MagicMock()
-        self.sts_helper = STS(self.sts_client)
+        self.sts_client.reset_mock()
+        # reset the child directly, Python 3.8 does not pass return_value=True down to children
+        self.sts_client.assume_role.reset_mock(return_value=True)
+        self.boto3_mock.reset_mock()
 
     def test_assume_role(self):
-        """test getting credentials by assuming a role in a account"""
-        self.sts_helper.assume_role("1234", "fake-role")
-
-        self.sts_client.assume_role.assert_called_once_with(
-            RoleArn="arn:aws:iam::1234:role/fake-role", RoleSessionName="AssumedRole"
-        )
+        """test getting credentials by assuming a role in a account, with and without a session name"""
+        for args, session_name in (
+            ((), "AssumedRole"),
+            (("fake-session-name",), "fake-session-name"),
+        ):
+            with self.subTest(session_name=session_name):
+                self.sts_client.reset_mock()
 
-    def test_assume_role_with_session_name(self):
-        """test getting credentials by assuming a role in a account with a session name"""
-        self.sts_helper.assume_role("1234", "fake-role", "fake-session-name")
+                self.sts_helper.assume_role("1234", "fake-role", *args)
 
-        self.sts_client.assume_role.assert_called_once_with(
-            RoleArn="arn:aws:iam::1234:role/fake-role",
-            RoleSessionName="fake-session-name",
-        )
+                self.assertEqual(1, self.sts_client.assume_role.call_count)
+                self.assertEqual(
+                    call(
+                        RoleArn="arn:aws:iam::1234:role/fake-role",
+                        RoleSessionName=session_name,
+                    ),
+                    self.sts_client.assume_role.call_args,
+                )
 
     def test_get_boto3_client(self):
         """test getting a boto3 client with an assumed role"""
@@ -38,20 +51,23 @@ class TestSTSHelper(TestCase):
                 "SessionToken": "baz",
             }
         }
-        with patch("amplify_aws_utils.clients.sts.boto3.client") as boto3_mock:
-            self.sts_helper.get_boto3_client_for_account(
-                "1234", "fake-role", "s3", region_name="us-moon-1"
-            )
+        self.sts_helper.get_boto3_client_for_account(
+            "1234", "fake-role", "s3", region_name="us-moon-1"
+        )
 
-            self.sts_client.assume_role.assert_called_once_with(
+        self.assertEqual(1, self.sts_client.assume_role.call_count)
+        self.assertEqual(
+            call(
                 RoleArn="arn:aws:iam::1234:role/fake-role",
                 RoleSessionName="AssumedRole",
-            )
-
-            boto3_mock.assert_called_once_with(
-                "s3",
-                aws_access_key_id="foo",
-                aws_secret_access_key="bar",
-                aws_session_token="baz",
-                region_name="us-moon-1",
-            )
+            ),
+            self.sts_client.assume_role.call_args,
+        )
+
+        self.boto3_mock.assert_called_once_with(
+            "s3",
+            aws_access_key_id="foo",
+            aws_secret_access_key="bar",
+            aws_session_token="baz",
+            region_name="us-moon-1",
+        )